@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import numbers
+from concurrent.futures import Future, ThreadPoolExecutor
 from queue import Empty
 from typing import Dict, List, Optional, Tuple
 
@@ -9,12 +10,12 @@ import numpy as np
 import torch
 from torch import Tensor
 
-from sample_factory.algo.sampling.sampling_utils import VectorEnvRunner, record_episode_statistics_wrapper_stats
+from sample_factory.algo.sampling.sampling_utils import VectorEnvRunner
 from sample_factory.algo.utils.env_info import EnvInfo, check_env_info
 from sample_factory.algo.utils.make_env import BatchedVecEnv, SequentialVectorizeWrapper, make_env_func_batched
 from sample_factory.algo.utils.misc import EPISODIC, POLICY_ID_KEY
 from sample_factory.algo.utils.tensor_dict import TensorDict
-from sample_factory.algo.utils.torch_utils import synchronize
+from sample_factory.algo.utils.torch_utils import stream_context, synchronize
 from sample_factory.envs.env_utils import (
     TrainingInfoInterface,
     find_training_info_interface,
@@ -22,25 +23,30 @@ from sample_factory.envs.env_utils import (
     set_training_info,
 )
 from sample_factory.utils.attr_dict import AttrDict
-from sample_factory.utils.dicts import iterate_recursively_with_prefix
+from sample_factory.utils.dicts import copy_dict_structure, iter_dicts_recursively, iterate_recursively_with_prefix
 from sample_factory.utils.typing import PolicyID
 from sample_factory.utils.utils import log
 
 
-def preprocess_actions(env_info: EnvInfo, actions: Tensor | np.ndarray) -> Tensor | np.ndarray | List:
+def preprocess_actions(
+    env_info: EnvInfo, actions: Tensor | np.ndarray, staging: Optional[Tuple[Tensor, np.ndarray]] = None
+) -> Tensor | np.ndarray | List:
     """
     We expect actions to have shape [num_envs, num_actions].
     For environments that require only one action per step we just squeeze the second dimension,
     because in this case the action is usually expected to be a scalar.
 
+    staging is an optional pair (pinned CPU tensor, numpy view of it) reused across calls for the
+    device-to-host action transfer (see BatchedVectorEnvRunner.init()).
+
     A potential way to reduce this complexity: demand all environments to have a Tuple action space even if they
     only have a single Discrete or Box action space.
     """
 
     if env_info.all_discrete or isinstance(env_info.action_space, gym.spaces.Discrete):
-        return process_action_space(actions, env_info.gpu_actions, is_discrete=True)
+        return process_action_space(actions, env_info.gpu_actions, is_discrete=True, staging=staging)
     elif isinstance(env_info.action_space, gym.spaces.Box):
-        return process_action_space(actions, env_info.gpu_actions, is_discrete=False)
+        return process_action_space(actions, env_info.gpu_actions, is_discrete=False, staging=staging)
     elif isinstance(env_info.action_space, gym.spaces.Tuple):
         # input is (num_envs, num_actions)
         out_actions = []
@@ -55,11 +61,26 @@ def preprocess_actions(env_info: EnvInfo, actions: Tensor | np.ndarray) -> Tenso
     raise NotImplementedError(f"Unknown action space type: {env_info.action_space}")
 
 
-def process_action_space(actions: torch.Tensor, gpu_actions: bool, is_discrete: bool):
-    if is_discrete:
-        actions = actions.to(torch.int32)
-    if not gpu_actions:
-        actions = actions.cpu().numpy()
+def process_action_space(
+    actions: torch.Tensor, gpu_actions: bool, is_discrete: bool, staging: Optional[Tuple[Tensor, np.ndarray]] = None
+):
+    if gpu_actions:
+        if is_discrete:
+            actions = actions.to(torch.int32)
+    else:
+        if staging is not None and actions.is_cuda:
+            # reuse the persistent pinned buffer: the D2H copy becomes a DMA transfer (with the dtype
+            # cast fused into it) and we avoid allocating a fresh pageable numpy array every step.
+            # The env sees a zero-copy numpy view of the pinned memory.
+            pinned, actions_np = staging
+            pinned.copy_(actions)
+            actions = actions_np
+        elif is_discrete:
+            # fused dtype cast + device copy: no int32 tensor is allocated on the device and,
+            # for int64 action tensors on GPU, we move half the number of bytes over PCIe
+            actions = actions.to(dtype=torch.int32, device="cpu").numpy()
+        else:
+            actions = actions.cpu().numpy()
 
     # action tensor/array should have two dimensions (num_agents, num_actions) where num_agents is a number of
     # individual actors in a vectorized environment (whether actually different agents or separate envs - does not
@@ -129,13 +150,44 @@ class BatchedVectorEnvRunner(VectorEnvRunner):
 
         self.last_obs = None
         self.last_rnn_state = None
+        self.zero_rnn_state = None
+        self.dones_mask = None
         self.policy_id_buffer = None
 
+        # pinned staging buffers for CPU observations sampled on a GPU device (see init())
+        self.obs_staging: Optional[TensorDict] = None
+
+        # persistent pinned buffer + numpy view for device->host action transfers (see init())
+        self.actions_staging: Optional[Tuple[Tensor, np.ndarray]] = None
+
+        # dedicated CUDA stream for trajectory-buffer copies (see init())
+        self.transfer_stream: Optional[torch.cuda.Stream] = None
+
         self.curr_traj: Optional[TensorDict] = None
         self.curr_step: Optional[TensorDict] = None
         self.curr_traj_slice: Optional[slice] = None
 
-        self.curr_episode_reward = self.curr_episode_len = None
+        # trajectory buffers are recycled from a small pool, so we build the TensorDict views
+        # (and the per-step views) for each buffer slice only once (see update_trajectory_buffers())
+        self.traj_view_cache: Dict = {}
+        self.step_view_cache: Dict = {}
+        self.curr_step_views: Optional[List[TensorDict]] = None
+
+        self.episode_stats = None
+        self.episode_len_increment = 1.0
+
+        # persistent buffer for scaled/clamped rewards, allocated on the first env step
+        self.rewards_scaled: Optional[Tensor] = None
+
+        # per-step snapshots of episode stats, transferred to the host once per rollout
+        self.pending_episode_stats: List[Tuple] = []
+
+        # bound on the first env step depending on the infos format (dict of tensors vs list of dicts)
+        self.snapshot_infos_func = None
+
+        # episodic reports are assembled on a background thread, off the critical sampling path
+        self.stats_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"stats_{worker_idx}_{split_idx}")
+        self.pending_stat_reports: List[Future] = []
 
         self.training_info: List[Optional[Dict]] = training_info
 
@@ -185,45 +237,150 @@ class BatchedVectorEnvRunner(VectorEnvRunner):
         # we assume that all data will be on the same device
         self.device = self.last_rnn_state.device
 
+        # cached scalar zero used to reset hidden states of finished episodes (see advance_rollouts())
+        self.zero_rnn_state = torch.zeros((), dtype=self.last_rnn_state.dtype, device=self.device)
+
+        # persistent bool mask of finished episodes, refreshed in place every step
+        self.dones_mask = torch.zeros((self.vec_env.num_agents, 1), dtype=torch.bool, device=self.device)
+
         self.policy_id_buffer = torch.empty_like(self.traj_tensors["policy_id"][0 : self.vec_env.num_agents, 0])
         self.policy_id_buffer[:] = self.policy_id
 
+        # for CPU envs sampled on a GPU device we stage observations in pinned memory:
+        # copies from pageable memory are always blocking, while pinned buffers allow non-blocking
+        # H2D transfers that can overlap with other work (we synchronize before the data is consumed,
+        # see synchronize_devices())
+        if self.device.type == "cuda":
+            staging = TensorDict()
+            for key, value in self.last_obs.items():
+                if isinstance(value, Tensor) and value.device.type == "cpu":
+                    staging[key] = torch.empty_like(value, pin_memory=True)
+            if staging:
+                self.obs_staging = staging
+
+        if (
+            self.device.type == "cuda"
+            and not self.env_info.gpu_actions
+            and not isinstance(self.env_info.action_space, gym.spaces.Tuple)
+        ):
+            # actions computed on the GPU but consumed by a CPU env: stage the D2H transfer in
+            # pinned memory and hand the env a reusable numpy view of it
+            is_discrete = self.env_info.all_discrete or isinstance(self.env_info.action_space, gym.spaces.Discrete)
+            actions_shape = self.policy_output_tensors["actions"].shape
+            actions_dtype = torch.int32 if is_discrete else self.policy_output_tensors["actions"].dtype
+            pinned_actions = torch.empty(actions_shape, dtype=actions_dtype, pin_memory=True)
+            self.actions_staging = (pinned_actions, pinned_actions.numpy())
+
+        if self.device.type == "cuda" and not self.cfg.serial_mode:
+            # issue trajectory-buffer copies on a dedicated stream so they overlap with the host-side
+            # env step and with inference compute on the default stream. synchronize_devices() makes
+            # sure all of them are finished before the inference worker consumes the data
+            # (in serial mode we stay on the default stream - there synchronize_devices() is a no-op
+            # and correctness relies on default-stream ordering)
+            self.transfer_stream = torch.cuda.Stream(device=self.device)
+
         assert self.rollout_step == 0
 
-        self.curr_episode_reward = torch.zeros(self.vec_env.num_agents)
-        self.curr_episode_len = torch.zeros(self.vec_env.num_agents, dtype=torch.int32)
-        self.min_raw_rewards = torch.empty_like(self.curr_episode_reward).fill_(np.inf)
-        self.max_raw_rewards = torch.empty_like(self.curr_episode_reward).fill_(-np.inf)
+        # keep episode counters on the same device as rewards/dones so we never have to
+        # synchronize with the device on the hot path (see _process_env_step()).
+        # reward (col 0) and length (col 1) are packed into one contiguous buffer so the per-step
+        # add/increment/mask-reset sequence touches a single cache line per agent
+        self.episode_stats = torch.zeros((self.vec_env.num_agents, 2), dtype=torch.float32, device=self.device)
+        self.episode_len_increment = float(self.env_info.frameskip if self.cfg.summaries_use_frameskip else 1)
+        self.min_raw_rewards = torch.empty(self.vec_env.num_agents, device=self.device).fill_(np.inf)
+        self.max_raw_rewards = torch.empty(self.vec_env.num_agents, device=self.device).fill_(-np.inf)
 
         self.env_step_ready = True
 
-    def _process_rewards(self, rewards_orig: Tensor, rewards_orig_cpu: Tensor) -> Tensor:
-        rewards = rewards_orig * self.cfg.reward_scale
-        rewards.clamp_(-self.cfg.reward_clip, self.cfg.reward_clip)
-        self.min_raw_rewards = torch.min(self.min_raw_rewards, rewards_orig_cpu)
-        self.max_raw_rewards = torch.max(self.max_raw_rewards, rewards_orig_cpu)
-        return rewards
+    def _process_rewards(self, rewards_orig: Tensor) -> Tensor:
+        if rewards_orig.device != self.episode_stats.device:
+            # the env returned data on a different device than we guessed in init()
+            # (i.e. CPU rewards with a GPU sampling device) - move the episode counters there once
+            self._move_episode_stats(rewards_orig.device)
 
-    def _process_env_step(self, rewards: Tensor, dones_orig: Tensor, infos):
-        dones = dones_orig.cpu()
-        num_dones = dones.sum().item()
+        if self.rewards_scaled is None or self.rewards_scaled.device != rewards_orig.device:
+            self.rewards_scaled = torch.empty_like(rewards_orig)
 
-        self.curr_episode_reward += rewards
-        self.curr_episode_len += self.env_info.frameskip if self.cfg.summaries_use_frameskip else 1
-
-        reports = []
-        if num_dones <= 0:
-            return reports
+        # scale and clamp in place into the persistent buffer - no per-step allocation
+        # (the result is consumed by the trajectory write before the next step overwrites it)
+        rewards = self.rewards_scaled
+        torch.mul(rewards_orig, self.cfg.reward_scale, out=rewards)
+        rewards.clamp_(-self.cfg.reward_clip, self.cfg.reward_clip)
+        self.min_raw_rewards = torch.min(self.min_raw_rewards, rewards_orig)
+        self.max_raw_rewards = torch.max(self.max_raw_rewards, rewards_orig)
+        return rewards
 
-        finished = dones.nonzero(as_tuple=True)[0]
+    def _staged_obs(self) -> Dict | TensorDict:
+        """Latest observations, with CPU tensors staged in pinned memory for non-blocking H2D copies."""
+        if self.obs_staging is None:
+            return self.last_obs
+
+        obs = dict(self.last_obs)
+        for key, staged in self.obs_staging.items():
+            staged.copy_(self.last_obs[key])
+            obs[key] = staged
+        return obs
+
+    def _move_episode_stats(self, device: torch.device) -> None:
+        self.episode_stats = self.episode_stats.to(device)
+        self.min_raw_rewards = self.min_raw_rewards.to(device)
+        self.max_raw_rewards = self.max_raw_rewards.to(device)
+
+    @staticmethod
+    def _snapshot_dict_infos(infos):
+        # dict of tensors (i.e. IsaacGym) - the env can overwrite these buffers in-place on the next step,
+        # so we clone the tensor leaves on their own device (no device->host transfer here; the values
+        # are only pulled to the host by the background stats thread)
+        snapshot = copy_dict_structure(infos)
+        for _, d2, key, value, _ in iter_dicts_recursively(infos, snapshot):
+            d2[key] = value.clone() if isinstance(value, Tensor) else value
+        return snapshot
+
+    @staticmethod
+    def _snapshot_list_infos(infos):
+        # list of dicts - the env creates fresh dicts every step, safe to keep a reference
+        return infos
+
+    def _process_env_step(self, rewards: Tensor, dones: Tensor, infos):
+        """
+        Accumulate episode stats for the current step without synchronizing with the device.
+        Calling .cpu()/.item() here would be a blocking device->host sync every step, stalling the whole
+        pipeline on GPU envs. Instead we snapshot the counters (fixed-shape tensors, no nonzero() calls)
+        and postpone the actual transfer until the end of the rollout (see _retrieve_episodic_stats()).
+        """
+        self.episode_stats[:, 0].add_(rewards)
+        self.episode_stats[:, 1].add_(self.episode_len_increment)
+
+        if not dones.is_cuda and not dones.any():
+            # host-side dones: checking for finished episodes costs nothing, and on most steps there
+            # are none - skip the snapshot/reset work entirely. For device-side dones this check would
+            # itself be a blocking device->host sync, so there we keep the sync-free snapshot path.
+            return
+
+        if self.snapshot_infos_func is None:
+            # the only way to reliably find out the infos format is to look at what the env returns
+            self.snapshot_infos_func = (
+                self._snapshot_dict_infos if isinstance(infos, dict) else self._snapshot_list_infos
+            )
 
-        stats = dict(
-            reward=self.curr_episode_reward[finished],
-            len=self.curr_episode_len[finished],
-            min_raw_reward=self.min_raw_rewards[finished],
-            max_raw_reward=self.max_raw_rewards[finished],
+        finished = dones.bool()
+        finished_col = finished.unsqueeze(-1)
+        self.pending_episode_stats.append(
+            (
+                finished,
+                torch.where(finished_col, self.episode_stats, 0.0),
+                torch.where(finished, self.min_raw_rewards, 0.0),
+                torch.where(finished, self.max_raw_rewards, 0.0),
+                self.snapshot_infos_func(infos),
+            )
         )
 
+        # zero the counters for finished episodes (masked ops instead of index assignment - no syncs)
+        self.episode_stats.masked_fill_(finished_col, 0)
+        self.min_raw_rewards.masked_fill_(finished, np.inf)
+        self.max_raw_rewards.masked_fill_(finished, -np.inf)
+
+    def _episodic_stats(self, stats: Dict, infos, finished: np.ndarray) -> Dict:
         if isinstance(infos, dict):
             # vectorized reports
             for _, key, value, prefix in iterate_recursively_with_prefix(infos):
@@ -236,7 +393,7 @@ class BatchedVectorEnvRunner(VectorEnvRunner):
                         stats[key_str] = value.item()
                     elif len(value.shape) >= 1 and len(value) == self.vec_env.num_agents:
                         # saving value for all agents who finished the episode
-                        stats[key_str] = value[finished]
+                        stats[key_str] = value.cpu().numpy()[finished]
                     else:
                         log.warning(f"Infos tensor with unexpected shape {value.shape}")
                 elif isinstance(value, numbers.Number):
@@ -246,19 +403,14 @@ class BatchedVectorEnvRunner(VectorEnvRunner):
 
             assert isinstance(infos, (list, tuple)), "Expect infos to be a list or tuple of dicts"
 
-            # some envs like Atari use a special wrapper to record episode statistics
-            stats_rew, stats_len = [], []
-            for agent_i in finished.tolist():
-                episode_wrapper_stats = record_episode_statistics_wrapper_stats(infos[agent_i])
-                if episode_wrapper_stats is not None:
-                    wrapper_rew, wrapper_len = episode_wrapper_stats
-                    stats_rew.append(wrapper_rew)
-                    stats_len.append(wrapper_len)
-
-            if stats_rew and stats_len:
+            # some envs like Atari use a special wrapper to record episode statistics.
+            # pre-extract the nested dicts in one pass, then convert to arrays in bulk - cheaper than
+            # building per-agent tuples, and it runs on the background stats thread anyway
+            ep_infos = [ep_info for agent_i in finished.tolist() if (ep_info := infos[agent_i].get("episode"))]
+            if ep_infos:
                 # length of these might not match len(finished), but stats handler does not care
-                stats["RecordEpisodeStatistics_reward"] = np.array(stats_rew)
-                stats["RecordEpisodeStatistics_len"] = np.array(stats_len)
+                stats["RecordEpisodeStatistics_reward"] = np.array([e["r"] for e in ep_infos])
+                stats["RecordEpisodeStatistics_len"] = np.array([e["l"] for e in ep_infos])
 
         # make sure everything in the dict is either a scalar or a numpy array
         for key, value in stats.items():
@@ -269,12 +421,34 @@ class BatchedVectorEnvRunner(VectorEnvRunner):
                     value, numbers.Number
                 ), f"Expect stats[{key}] to be a scalar or numpy array, got {type(value)}"
 
-        reports.append({EPISODIC: stats, POLICY_ID_KEY: self.policy_id})
+        return stats
 
-        self.curr_episode_reward[finished] = 0
-        self.curr_episode_len[finished] = 0
-        self.min_raw_rewards[finished] = np.inf
-        self.max_raw_rewards[finished] = -np.inf
+    def _retrieve_episodic_stats(self, pending_episode_stats: List[Tuple]) -> List[Dict]:
+        """
+        Called once per rollout on the background stats thread: a few batched device->host transfers
+        instead of several per step, overlapped with env stepping and inference.
+        """
+        reports = []
+        finished_masks, ep_stats, min_raw, max_raw, step_infos = zip(*pending_episode_stats)
+
+        finished_masks = torch.stack(finished_masks).cpu().numpy()
+        ep_stats = torch.stack(ep_stats).cpu().numpy()
+        min_raw = torch.stack(min_raw).cpu().numpy()
+        max_raw = torch.stack(max_raw).cpu().numpy()
+
+        for step, infos in enumerate(step_infos):
+            finished = np.flatnonzero(finished_masks[step])
+            if finished.size == 0:
+                continue
+
+            stats = dict(
+                reward=ep_stats[step, finished, 0],
+                len=ep_stats[step, finished, 1].astype(np.int32),
+                min_raw_reward=min_raw[step][finished],
+                max_raw_reward=max_raw[step][finished],
+            )
+            stats = self._episodic_stats(stats, infos, finished)
+            reports.append({EPISODIC: stats, POLICY_ID_KEY: self.policy_id})
 
         return reports
 
@@ -298,9 +472,7 @@ class BatchedVectorEnvRunner(VectorEnvRunner):
         the next env step.
         """
         with timing.add_time("process_policy_outputs"):
-            # save actions/logits/values etc. for the current rollout step
-            self.curr_step[:] = self.policy_output_tensors
-            actions = preprocess_actions(self.env_info, self.policy_output_tensors["actions"])
+            actions = preprocess_actions(self.env_info, self.policy_output_tensors["actions"], self.actions_staging)
 
         complete_rollouts, episodic_stats = [], []
 
@@ -312,28 +484,50 @@ class BatchedVectorEnvRunner(VectorEnvRunner):
             self.policy_id_buffer[:] = self.policy_id
 
             # record the results from the env step
-            rewards_cpu = rewards.cpu()
-            processed_rewards = self._process_rewards(rewards, rewards_cpu)
-            self.curr_step[:] = dict(
-                rewards=processed_rewards,
-                dones=dones,
-                time_outs=truncated,  # true only when done is also true, used for value bootstrapping
-                policy_id=self.policy_id_buffer,
-            )
+            processed_rewards = self._process_rewards(rewards)
+
+            # single fused write per step: actions/logits/values etc. together with rewards, dones and
+            # the rest of the env step results. The inference worker will not touch policy_output_tensors
+            # until we send the next policy request, so it is safe to defer this copy until after the env step.
+            if self.transfer_stream is not None:
+                # tensors produced on the default stream must be ready before we copy them
+                self.transfer_stream.wait_stream(torch.cuda.current_stream(self.device))
+            with stream_context(self.transfer_stream):
+                self.curr_step.bulk_copy_(
+                    slice(None),
+                    dict(
+                        self.policy_output_tensors,
+                        rewards=processed_rewards,
+                        dones=dones,
+                        time_outs=truncated,  # true only when done is also true, used for value bootstrapping
+                        policy_id=self.policy_id_buffer,
+                    ),
+                )
 
             # reset next-step hidden states to zero if we encountered an episode boundary
             # not sure if this is the best practice, but this is what everybody seems to be doing
-            not_done = (1.0 - self.curr_step["dones"].float()).unsqueeze(-1)
-            self.last_rnn_state = self.policy_output_tensors["new_rnn_states"] * not_done
+            # (branchless select into preallocated buffers - no float mask, no per-step allocations)
+            self.dones_mask.copy_(dones.unsqueeze(-1))
+            torch.where(
+                self.dones_mask,
+                self.zero_rnn_state,
+                self.policy_output_tensors["new_rnn_states"],
+                out=self.last_rnn_state,
+            )
 
             with timing.add_time("process_env_step"):
-                stats = self._process_env_step(rewards_cpu, dones, infos)
-            episodic_stats.extend(stats)
+                self._process_env_step(rewards, dones, infos)
 
         self.rollout_step += 1
 
         with timing.add_time("finalize_trajectories"):
             if self.rollout_step == self.cfg.rollout:
+                # hand the accumulated stats over to the background thread; results are picked up
+                # in one of the next advance_rollouts() calls
+                if self.pending_episode_stats:
+                    pending, self.pending_episode_stats = self.pending_episode_stats, []
+                    self.pending_stat_reports.append(self.stats_executor.submit(self._retrieve_episodic_stats, pending))
+
                 # finalize and serialize the trajectory if we have a complete rollout
                 complete_rollouts = self._finalize_trajectories()
                 self.rollout_step = 0
@@ -345,6 +539,8 @@ class BatchedVectorEnvRunner(VectorEnvRunner):
                     set_reward_shaping(self.vec_env, reward_shaping, slice(0, self.vec_env.num_agents))
                     set_training_info(self.env_training_info_interface, self.training_info[self.policy_id])
 
+        episodic_stats.extend(self._completed_stat_reports())
+
         self.env_step_ready = True
         return complete_rollouts, episodic_stats
 
@@ -360,7 +556,16 @@ class BatchedVectorEnvRunner(VectorEnvRunner):
                 return False
 
             self.curr_traj_slice = buffers
-            self.curr_traj = self.traj_tensors[self.curr_traj_slice]
+
+            # slice objects are not hashable until Python 3.12, hence the tuple key
+            key = (buffers.start, buffers.stop, buffers.step) if isinstance(buffers, slice) else buffers
+            curr_traj = self.traj_view_cache.get(key)
+            if curr_traj is None:
+                curr_traj = self.traj_view_cache[key] = self.traj_tensors[self.curr_traj_slice]
+                self.step_view_cache[key] = [curr_traj[:, step] for step in range(self.cfg.rollout)]
+
+            self.curr_traj = curr_traj
+            self.curr_step_views = self.step_view_cache[key]
             return True
 
     def generate_policy_request(self) -> Optional[Dict]:
@@ -372,9 +577,16 @@ class BatchedVectorEnvRunner(VectorEnvRunner):
             # we don't have a shared buffer to store data in - still waiting for one to become available
             return None
 
-        self.curr_step = self.curr_traj[:, self.rollout_step]
-        # save observations and RNN states in a trajectory
-        self.curr_step[:] = dict(obs=self.last_obs, rnn_states=self.last_rnn_state)
+        self.curr_step = self.curr_step_views[self.rollout_step]
+        # save observations and RNN states in a trajectory: write straight into the cached leaf views
+        # for this step, bypassing TensorDict dispatch entirely on this hottest of paths
+        if self.transfer_stream is not None:
+            self.transfer_stream.wait_stream(torch.cuda.current_stream(self.device))
+        with stream_context(self.transfer_stream):
+            obs_dst = self.curr_step["obs"]
+            for key, value in self._staged_obs().items():
+                obs_dst[key].copy_(value, non_blocking=True)
+            self.curr_step["rnn_states"].copy_(self.last_rnn_state, non_blocking=True)
         policy_request = {self.policy_id: (self.curr_traj_slice, self.rollout_step)}
         self.env_step_ready = False
         return policy_request
@@ -383,5 +595,12 @@ class BatchedVectorEnvRunner(VectorEnvRunner):
         """Make sure all writes to shared device buffers are finished."""
         synchronize(self.cfg, self.device)
 
+    def _completed_stat_reports(self) -> List[Dict]:
+        reports = []
+        while self.pending_stat_reports and self.pending_stat_reports[0].done():
+            reports.extend(self.pending_stat_reports.pop(0).result())
+        return reports
+
     def close(self):
+        self.stats_executor.shutdown(wait=False)
         self.vec_env.close()
@@ -131,6 +131,9 @@ class InferenceWorker(HeartbeatStoppableEventLoopObject, Configurable):
 
         self._prepare_policy_outputs_func: PrepareOutputsFunc = prepare_policy_outputs
 
+        # lazily created torch.compile wrapper for the actor-critic forward pass (see _handle_policy_steps())
+        self._compiled_forward = None
+
         self.is_initialized = False
 
     @signal
@@ -313,7 +316,9 @@ class InferenceWorker(HeartbeatStoppableEventLoopObject, Configurable):
         return signals_to_send
 
     def _handle_policy_steps(self, timing):
-        with inference_context(self.cfg.serial_mode):
+        # dynamo guards don't play well with inference_mode tensors (dispatch key mismatch),
+        # so compiled inference runs under no_grad instead
+        with inference_context(self.cfg.serial_mode or self.cfg.compile_inference):
             obs, rnn_states = self._batch_func(timing)
             num_samples = rnn_states.shape[0]
             self.total_num_samples += num_samples
@@ -327,7 +332,14 @@ class InferenceWorker(HeartbeatStoppableEventLoopObject, Configurable):
                 rnn_states = ensure_torch_tensor(rnn_states).to(self.device).float()
 
             with timing.add_time("forward"):
-                policy_outputs = actor_critic(normalized_obs, rnn_states)
+                if self.cfg.compile_inference:
+                    if self._compiled_forward is None:
+                        # with batched sampling shapes are constant, so we compile once and never retrace.
+                        # weight updates happen in-place via load_state_dict() and don't invalidate the graph
+                        self._compiled_forward = torch.compile(actor_critic, mode="reduce-overhead")
+                    policy_outputs = self._compiled_forward(normalized_obs, rnn_states)
+                else:
+                    policy_outputs = actor_critic(normalized_obs, rnn_states)
                 policy_outputs["policy_version"] = torch.empty([num_samples]).fill_(self.param_client.policy_version)
 
             with timing.add_time("prepare_outputs"):
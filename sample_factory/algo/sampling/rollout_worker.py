@@ -62,7 +62,11 @@ def init_rollout_worker_process(sf_context: SampleFactoryContext, worker: Rollou
 
     if cfg.num_workers > 1:
         psutil.Process().nice(min(cfg.default_niceness + 10, 20))
-        torch.set_num_threads(1)
+
+    # even a single-worker sampler (i.e. a typical IsaacGym setup) should not spawn an OMP/MKL
+    # thread pool: the env step is single-threaded and runner-side torch ops are tiny, so the
+    # extra threads only cause contention with other components
+    torch.set_num_threads(1)
 
     if cfg.actor_worker_gpus:
         worker_gpus = set_gpus_for_process(
@@ -54,6 +54,12 @@ class ParameterClient:
 
         self.latest_policy_version = -1
 
+        # numpy view of the shared policy_versions tensor: the server version is polled on every
+        # inference iteration and a plain numpy read is much cheaper than a torch .item() dispatch.
+        # Created lazily in the worker process: a numpy array would be pickled by value on spawn,
+        # severing the connection to shared memory, while the torch tensor is pickled via shm handles.
+        self._policy_versions_np = None
+
         self._actor_critic = None
         self._policy_lock = param_server.policy_lock
 
@@ -68,7 +74,9 @@ class ParameterClient:
         return self.latest_policy_version
 
     def _get_server_policy_version(self):
-        return self.policy_versions[self.policy_id].item()
+        if self._policy_versions_np is None:
+            self._policy_versions_np = self.policy_versions.numpy()
+        return int(self._policy_versions_np[self.policy_id])
 
     def on_weights_initialized(self, state_dict, device: torch.device, policy_version: int) -> None:
         self.latest_policy_version = policy_version
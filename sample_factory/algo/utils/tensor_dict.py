@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 import torch
@@ -19,6 +19,11 @@ from sample_factory.utils.utils import log
 class TensorDict(dict):
     dict_key_type = str
 
+    # memoized flat views of the (nested) dict used on hot paths, see _flatten()
+    # class-level defaults so unpickled instances (which bypass __init__) are handled correctly
+    _flat_cache: Optional[List[Tuple[Tuple[str, ...], Tensor]]] = None
+    _flat_map_cache: Optional[Dict[Tuple[str, ...], Tensor]] = None
+
     def __getitem__(self, key):
         if isinstance(key, self.dict_key_type):
             # if key is string assume we're accessing dict's interface
@@ -39,34 +44,113 @@ class TensorDict(dict):
 
     def __setitem__(self, key, value):
         if isinstance(key, self.dict_key_type):
+            self._flat_cache = self._flat_map_cache = None  # dict structure might have changed
             dict.__setitem__(self, key, value)
         else:
             self._set_data_func(self, key, value)
 
-    def _set_data_func(self, x, index, new_data):
+    def _set_data_func(self, x, index, new_data, non_blocking=False):
         if isinstance(new_data, (dict, TensorDict)):
             for new_data_key, new_data_value in new_data.items():
-                self._set_data_func(x.get(new_data_key), index, new_data_value)
+                self._set_data_func(x.get(new_data_key), index, new_data_value, non_blocking)
         else:
-            if torch.is_tensor(x):
-                if isinstance(new_data, torch.Tensor):
-                    t = new_data
-                elif isinstance(new_data, np.ndarray):
-                    t = torch.from_numpy(new_data)
+            self._set_leaf_func(x, index, new_data, non_blocking)
+
+    @staticmethod
+    def _set_leaf_func(x, index, new_data, non_blocking=False):
+        if torch.is_tensor(x):
+            if isinstance(new_data, torch.Tensor):
+                x[index].copy_(new_data, non_blocking=non_blocking)
+            elif isinstance(new_data, np.ndarray):
+                if x.device.type == "cpu":
+                    # plain numpy memcpy: skips the temporary tensor wrapper and the copy_ dispatch
+                    # ("unsafe" allows the same dtype conversions copy_ would do)
+                    np.copyto(x[index].numpy(), new_data, casting="unsafe")
                 else:
-                    raise ValueError(f"Type {type(new_data)} not supported in set_data_func")
-
-                x[index].copy_(t)
-
-            elif isinstance(x, np.ndarray):
-                if isinstance(new_data, torch.Tensor):
-                    n = new_data.cpu().numpy()
-                elif isinstance(new_data, np.ndarray):
-                    n = new_data
-                else:
-                    raise ValueError(f"Type {type(new_data)} not supported in set_data_func")
-
-                x[index] = n
+                    x[index].copy_(torch.from_numpy(new_data), non_blocking=non_blocking)
+            else:
+                raise ValueError(f"Type {type(new_data)} not supported in set_data_func")
+
+        elif isinstance(x, np.ndarray):
+            if isinstance(new_data, torch.Tensor):
+                n = new_data.cpu().numpy()
+            elif isinstance(new_data, np.ndarray):
+                n = new_data
+            else:
+                raise ValueError(f"Type {type(new_data)} not supported in set_data_func")
+
+            x[index] = n
+
+    def _flatten(self) -> List[Tuple[Tuple[str, ...], Tensor]]:
+        """
+        Flat list of (key path, leaf) pairs, memoized.
+
+        We only cache the top-level dict and assume the nested structure does not change between calls
+        (true for trajectory buffers which are allocated once and then only modified leaf-wise).
+        """
+        if self._flat_cache is None:
+            flat = []
+            self._flatten_func(self, (), flat)
+            self._flat_cache = flat
+        return self._flat_cache
+
+    @classmethod
+    def _flatten_func(cls, x, prefix: Tuple[str, ...], flat: List):
+        if isinstance(x, (dict, TensorDict)):
+            for key, value in x.items():
+                cls._flatten_func(value, prefix + (key,), flat)
+        else:
+            flat.append((prefix, x))
+
+    def bulk_set(self, index, new_data, non_blocking: bool = False) -> None:
+        """
+        Same as self[index] = new_data, but assigns leaves via memoized flat views instead of
+        recursively re-traversing both dicts on every call. Use on hot paths where the same dicts
+        are assigned over and over again (i.e. every step of a rollout).
+
+        With non_blocking=True the underlying copies are asynchronous (i.e. pinned memory to CUDA);
+        the caller is responsible for synchronizing the device before the data is consumed.
+        """
+        if isinstance(new_data, TensorDict):
+            src_flat = new_data._flatten()
+        else:
+            src_flat = []
+            self._flatten_func(new_data, (), src_flat)
+
+        if self._flat_map_cache is None:
+            self._flat_map_cache = dict(self._flatten())
+
+        dst_leaves = self._flat_map_cache
+        for path, src in src_flat:
+            dst = dst_leaves.get(path)
+            if dst is not None:
+                self._set_leaf_func(dst, index, src, non_blocking)
+
+    def bulk_copy_(self, index, new_data, non_blocking: bool = False) -> None:
+        """
+        Same as bulk_set(), but fuses all leaf copies into a single torch._foreach_copy_ multi-tensor
+        op (the same primitive fused optimizers use), so K leaves cost one kernel launch instead of K.
+        All destination leaves must be torch tensors; numpy sources are wrapped without a copy.
+        """
+        if isinstance(new_data, TensorDict):
+            src_flat = new_data._flatten()
+        else:
+            src_flat = []
+            self._flatten_func(new_data, (), src_flat)
+
+        if self._flat_map_cache is None:
+            self._flat_map_cache = dict(self._flatten())
+
+        dst_leaves = self._flat_map_cache
+        dst_list, src_list = [], []
+        for path, src in src_flat:
+            dst = dst_leaves.get(path)
+            if dst is not None:
+                dst_list.append(dst[index])
+                src_list.append(torch.from_numpy(src) if isinstance(src, np.ndarray) else src)
+
+        if dst_list:
+            torch._foreach_copy_(dst_list, src_list, non_blocking=non_blocking)
 
 
 def clone_tensordict(d: TensorDict) -> TensorDict:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 from typing import Optional
 
 import numpy as np
@@ -18,6 +19,13 @@ def init_torch_runtime(cfg: AttrDict, max_num_threads: Optional[int] = 1):
         torch.backends.cudnn.benchmark = True
 
 
+def stream_context(stream: Optional[torch.cuda.Stream]):
+    """CUDA stream context if a stream is provided, otherwise a no-op (i.e. CPU-only sampling)."""
+    if stream is None:
+        return contextlib.nullcontext()
+    return torch.cuda.stream(stream)
+
+
 def inference_context(is_serial):
     if is_serial:
         # in serial mode we use the same tensors on sampler and learner
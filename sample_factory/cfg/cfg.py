@@ -79,6 +79,15 @@ def add_rl_args(p: ArgumentParser):
         "If you need some complex info dictionary handling and your environment might return dicts with different keys, "
         "on different rollout steps, you probably need non-batched mode.",
     )
+    p.add_argument(
+        "--compile_inference",
+        default=False,
+        type=str2bool,
+        help="Compile the actor-critic forward pass on inference workers with torch.compile (mode='reduce-overhead'). "
+        "For small models the per-step Python/dispatch overhead often dominates inference time, so this can give a "
+        "significant throughput boost. Works best with batched sampling where batch shapes are constant and the "
+        "model is compiled exactly once; with non-batched sampling varying batch sizes will trigger recompilations.",
+    )
     p.add_argument(
         "--num_batches_to_accumulate",
         default=2,
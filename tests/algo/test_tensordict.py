@@ -48,6 +48,56 @@ class TestParams:
 
         # and we can do many other things...
 
+    def test_tensordict_bulk_set(self):
+        d = TensorDict()
+        d["obs"] = TensorDict(pos=torch.zeros((4, 8, 3)), vel=torch.zeros((4, 8, 3)))
+        d["rewards"] = torch.zeros((4, 8))
+
+        step_data = dict(obs=dict(pos=torch.ones((4, 3)), vel=torch.ones((4, 3))), rewards=np.ones((4,)))
+        d.bulk_set((slice(None), 2), step_data)
+
+        # bulk_set should be equivalent to a regular indexed assignment
+        step = d[:, 2]
+        assert step["obs"]["pos"].equal(torch.ones((4, 3)))
+        assert step["obs"]["vel"].equal(torch.ones((4, 3)))
+        assert step["rewards"].equal(torch.ones((4,)))
+        assert d[:, 1]["rewards"].equal(torch.zeros((4,)))
+
+        # keys missing in the destination are ignored, same as in a regular assignment
+        d.bulk_set((slice(None), 3), dict(rewards=np.full((4,), 2.0), unknown_key=np.ones((4,))))
+        assert d[:, 3]["rewards"].equal(torch.full((4,), 2.0))
+
+        # the memoized flat view is invalidated when the dict structure changes
+        d["dones"] = torch.zeros((4, 8))
+        d.bulk_set((slice(None), 0), dict(dones=np.ones((4,))))
+        assert d[:, 0]["dones"].equal(torch.ones((4,)))
+
+    def test_tensordict_bulk_copy(self):
+        d = TensorDict()
+        d["obs"] = TensorDict(pos=torch.zeros((4, 8, 3)), vel=torch.zeros((4, 8, 3)))
+        d["rewards"] = torch.zeros((4, 8))
+        d["dones"] = torch.zeros((4, 8), dtype=torch.bool)
+
+        # mix of nested dicts, numpy sources and dtype conversions (int64 ndarray -> float32 tensor,
+        # float tensor -> bool tensor), all fused into a single multi-tensor op
+        step_data = dict(
+            obs=dict(pos=torch.ones((4, 3)), vel=np.ones((4, 3), dtype=np.float32)),
+            rewards=np.arange(4),
+            dones=torch.ones((4,)),
+        )
+        d.bulk_copy_((slice(None), 5), step_data)
+
+        step = d[:, 5]
+        assert step["obs"]["pos"].equal(torch.ones((4, 3)))
+        assert step["obs"]["vel"].equal(torch.ones((4, 3)))
+        assert step["rewards"].equal(torch.arange(4, dtype=torch.float32))
+        assert step["dones"].dtype == torch.bool and step["dones"].all()
+        assert d[:, 4]["rewards"].equal(torch.zeros((4,)))
+
+        # keys missing in the destination are silently skipped, same as in a regular assignment
+        d.bulk_copy_((slice(None), 6), dict(rewards=torch.full((4,), 3.0), unknown_key=torch.ones((4,))))
+        assert d[:, 6]["rewards"].equal(torch.full((4,), 3.0))
+
     def test_cat_tensordicts(self):
         # noinspection DuplicatedCode
         d1 = TensorDict(dict(a=torch.zeros((2, 3)), b=torch.ones((2, 3))))